@@ -0,0 +1,127 @@
+export const emptyOracleExtras = Object.freeze({
+  anointed_ruler: false,
+  modern_ruler: false,
+  traditional_ruler: false,
+  dominant_ruler: false,
+  solar_ruler: false,
+  has_shapeshift: false,
+  shapeshift_description: '',
+  has_pet: false,
+  pet_name: '',
+  pet_description: '',
+  has_apprentice: false,
+  apprentice_name: '',
+  apprentice_description: '',
+  has_disciple: false,
+  disciple_name: '',
+  disciple_description: '',
+  has_legion: false,
+  legion_name: '',
+  legion_description: '',
+  has_legion_captain: false,
+  legion_captain_name: '',
+  legion_captain_description: '',
+  has_behemoth: false,
+  behemoth_name: '',
+  behemoth_description: '',
+  has_behemoth_fusion: false,
+  behemoth_fusion_name: '',
+  behemoth_fusion_crown: false,
+  behemoth_fusion_aura: false,
+  behemoth_fusion_description: ''
+});
+
+export function buildOracleRecord(row, { oracleId, timestamp, defaults = {}, overrides = {} }) {
+  const record = {
+    oracle_id: oracleId,
+    oracle_name: row.oracle_name || defaults.oracle_name || '',
+    archetype: row.archetype || 'Unformed Oracle',
+    oracle_type: row.oracle_type || 'Playable',
+    astrology_profile: {
+      ruling_planet: row.ruling_planet || '',
+      dominant_sign: row.dominant_sign || '',
+      house_placement: row.house_placement || '',
+      motion: row.motion || 'Direct',
+      stationary: row.stationary || '',
+      shadow: row.shadow || '',
+      degree: row.degree || '',
+      degree_mark: row.degree_mark || '',
+      decan: {
+        method: row.decan_method || 'Modern',
+        decan_ruler: row.decan_ruler || '',
+        decan_ruler_sign: row.decan_ruler_sign || '',
+        flavor: row.decan_flavor || 'Full'
+      },
+      rising_sign: row.rising_sign || defaults.rising_sign || '',
+      rising_decan_sign: row.rising_decan_sign || ''
+    },
+    faction_affiliation: {
+      core_faction: row.core_faction || defaults.core_faction || '',
+      planetary_faction: row.planetary_faction || defaults.planetary_faction || '',
+      tribe: row.tribe || '',
+      guild: row.guild || defaults.guild || ''
+    },
+    hardcore_status: row.hardcore_status ?? true,
+    level: row.level || 0,
+    tier: row.tier || 'Tier 1',
+    ascended_rank: row.ascended_rank || 0,
+    oracle_form: row.oracle_form || 'Base',
+    council_type: row.council_type || defaults.council_type || '',
+    descendant_relationship_state: row.descendant_relationship_state || 'Dormant',
+    oracle_locked: false,
+    oracle_voice: row.voice || defaults.oracle_voice || '',
+    tone_overlay: row.tone_overlay || defaults.tone_overlay || '',
+    oracle_metadata_last_updated: timestamp,
+    anointed_ruler: Boolean(row.anointed_ruler),
+    modern_ruler: Boolean(row.modern_ruler),
+    traditional_ruler: Boolean(row.traditional_ruler),
+    dominant_ruler: Boolean(row.dominant_ruler),
+    solar_ruler: Boolean(row.solar_ruler),
+    has_shapeshift: Boolean(row.has_shapeshift),
+    shapeshift_description: row.shapeshift_description || '',
+    has_pet: Boolean(row.has_pet),
+    pet_name: row.pet_name || '',
+    pet_description: row.pet_description || '',
+    has_apprentice: Boolean(row.has_apprentice),
+    apprentice_name: row.apprentice_name || '',
+    apprentice_description: row.apprentice_description || '',
+    has_disciple: Boolean(row.has_disciple),
+    disciple_name: row.disciple_name || '',
+    disciple_description: row.disciple_description || '',
+    has_legion: Boolean(row.has_legion),
+    legion_name: row.legion_name || '',
+    legion_description: row.legion_description || '',
+    has_legion_captain: Boolean(row.has_legion_captain),
+    legion_captain_name: row.legion_captain_name || '',
+    legion_captain_description: row.legion_captain_description || '',
+    has_behemoth: Boolean(row.has_behemoth),
+    behemoth_name: row.behemoth_name || '',
+    behemoth_description: row.behemoth_description || '',
+    has_behemoth_fusion: Boolean(row.has_behemoth_fusion),
+    behemoth_fusion_name: row.behemoth_fusion_name || '',
+    behemoth_fusion_crown: Boolean(row.behemoth_fusion_crown),
+    behemoth_fusion_aura: Boolean(row.behemoth_fusion_aura),
+    behemoth_fusion_description: row.behemoth_fusion_description || '',
+    visual_attributes: {
+      visual_description: {
+        head: row.head || '',
+        torso: row.torso || '',
+        arms: row.arms || '',
+        legs: row.legs || '',
+        aura: row.aura || '',
+        ambient_flavor: row.ambient_flavor || '',
+        visual_style_notes: row.visual_style_notes || '',
+        color_scheme: row.color_scheme || ''
+      },
+      weapons: {
+        weapon_1: row.weapon_1 || '',
+        weapon_2: row.weapon_2 || ''
+      },
+      oracle_avatar_url: row.oracle_avatar_url || '',
+      voice_style: row.voice_style || row.voice || '',
+      role_in_pantheon: row.role_in_pantheon || defaults.role_in_pantheon || '',
+      additional_notes: row.additional_notes || defaults.additional_notes || ''
+    }
+  };
+  return Object.assign(record, overrides);
+}
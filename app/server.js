@@ -1,402 +1,462 @@
 import http from 'node:http';
-import { readFile, writeFile } from 'node:fs/promises';
+import { open, readFile, rename, stat, writeFile } from 'node:fs/promises';
 import path from 'node:path';
+import { setTimeout as delay } from 'node:timers/promises';
 import { fileURLToPath } from 'node:url';
+import { buildOracleRecord, emptyOracleExtras } from './oracle-record.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 const root = path.resolve(__dirname, '..');
 const dataPath = path.join(root, 'app', 'data', 'state.json');
+const tempDataPath = `${dataPath}.tmp`;
+const renameRetryCodes = new Set(['EPERM', 'EBUSY']);
+const renameAttempts = 5;
 const publicDir = path.join(root, 'app', 'public');
+const jsonHeaders = { 'Content-Type': 'application/json; charset=utf-8' };
+const textHeaders = { 'Content-Type': 'text/plain; charset=utf-8' };
+const stateHeaders = { ...jsonHeaders, 'Cache-Control': 'no-cache' };
+const revalidateHeaders = { 'Cache-Control': 'no-cache' };
+const staticHeaders = new Map([
+  ['.html', { 'Content-Type': 'text/html; charset=utf-8' }],
+  ['.css', { 'Content-Type': 'text/css; charset=utf-8' }],
+  ['.js', { 'Content-Type': 'text/javascript; charset=utf-8' }]
+]);
+const indexFile = publicFile('index.html');
+const staticFiles = new Map([
+  ['/', indexFile],
+  ['/index.html', indexFile],
+  ['/styles.css', publicFile('styles.css')],
+  ['/app.js', publicFile('app.js')]
+]);
+const profileFields = ['username', 'email', 'gender', 'birthday', 'birth_time', 'birth_location'];
+const preferenceFields = ['oracle_voice_flavor', 'system_prompt_tone'];
+const notFoundText = Buffer.from('Not found');
+const oracleNotFoundBody = Buffer.from(encodeJson({ ok: false, error: 'Oracle not found' }));
+const providerNotFoundBody = Buffer.from(encodeJson({ ok: false, error: 'Provider not found' }));
+const sessionNotFoundBody = Buffer.from(encodeJson({ ok: false, error: 'Session not found' }));
+let stateCache = null;
+let stateLoad = null;
+let stateWrite = null;
+let queuedStateWrite = null;
+const stateTagPrefix = Date.now().toString(36);
+let stateTagCount = 0;
+const recordIndexes = new WeakMap();
+let lastIdTime = 0;
+let idSequence = 0;
+
+function encodeJson(data) {
+  return JSON.stringify(data);
+}
+
+function sendJsonBody(res, status, body) {
+  res.writeHead(status, jsonHeaders);
+  res.end(body);
+}
 
 function sendJson(res, status, data) {
-  res.writeHead(status, { 'Content-Type': 'application/json; charset=utf-8' });
-  res.end(JSON.stringify(data, null, 2));
+  sendJsonBody(res, status, encodeJson(data));
 }
 
-function sendText(res, status, text, contentType = 'text/plain; charset=utf-8') {
-  res.writeHead(status, { 'Content-Type': contentType });
+function sendText(res, status, text) {
+  res.writeHead(status, textHeaders);
   res.end(text);
 }
 
+function isStateCurrent(mtimeMs) {
+  return stateCache && (stateCache.mtimeMs === null || stateCache.mtimeMs === mtimeMs);
+}
+
+async function readStateFile() {
+  const handle = await open(dataPath, 'r');
+  try {
+    const { mtimeMs } = await handle.stat();
+    if (isStateCurrent(mtimeMs)) return stateCache;
+    return { state: JSON.parse(await handle.readFile('utf8')), mtimeMs };
+  } finally {
+    await handle.close();
+  }
+}
+
 async function loadState() {
-  const raw = await readFile(dataPath, 'utf8');
-  return JSON.parse(raw);
+  if (stateCache?.mtimeMs === null) return stateCache.state;
+  const { mtimeMs } = await stat(dataPath);
+  if (isStateCurrent(mtimeMs)) return stateCache.state;
+  const cached = stateCache;
+  stateLoad ??= readStateFile()
+    .then(loaded => {
+      if (stateCache === cached) stateCache = loaded;
+      return stateCache.state;
+    })
+    .finally(() => {
+      stateLoad = null;
+    });
+  return stateLoad;
 }
 
-async function saveState(state) {
-  state.meta.updatedAt = new Date().toISOString();
-  await writeFile(dataPath, JSON.stringify(state, null, 2) + '\n', 'utf8');
+async function loadStateBody() {
+  const state = await loadState();
+  stateCache.body ??= Buffer.from(encodeJson(state));
+  stateCache.etag ??= `"${stateTagPrefix}-${++stateTagCount}"`;
+  return stateCache;
 }
 
-async function serveFile(res, filePath, contentType) {
+async function replaceStateFile(attempt = 1) {
   try {
-    const data = await readFile(filePath);
-    res.writeHead(200, { 'Content-Type': contentType });
+    await rename(tempDataPath, dataPath);
+  } catch (error) {
+    if (attempt >= renameAttempts || !renameRetryCodes.has(error.code)) throw error;
+    await delay(attempt * 20);
+    return replaceStateFile(attempt + 1);
+  }
+}
+
+function writeStateFile() {
+  if (queuedStateWrite) return queuedStateWrite;
+  if (stateWrite) {
+    queuedStateWrite = stateWrite.catch(() => {}).then(() => {
+      queuedStateWrite = null;
+      return writeStateFile();
+    });
+    return queuedStateWrite;
+  }
+  const cache = stateCache;
+  stateWrite = writeFile(tempDataPath, cache.fileText, 'utf8')
+    .then(() => replaceStateFile())
+    .then(() => stat(dataPath))
+    .then(({ mtimeMs }) => {
+      cache.mtimeMs = mtimeMs;
+    })
+    .catch(error => {
+      if (stateCache === cache) stateCache = null;
+      throw error;
+    })
+    .finally(() => {
+      stateWrite = null;
+    });
+  return stateWrite;
+}
+
+async function saveState(state, updatedAt) {
+  state.meta.updatedAt = updatedAt;
+  stateCache = { state, mtimeMs: null, fileText: JSON.stringify(state, null, 2) + '\n' };
+  await writeStateFile();
+}
+
+function getIndex(records, key) {
+  let index = recordIndexes.get(records);
+  if (!index) {
+    index = new Map();
+    for (const record of records) {
+      if (!index.has(record[key])) index.set(record[key], record);
+    }
+    recordIndexes.set(records, index);
+  }
+  return index;
+}
+
+function findOracle(state, oracleId) {
+  return getIndex(state.oracles, 'oracle_id').get(oracleId);
+}
+
+function findProvider(state, providerId) {
+  return getIndex(state.llmProviders, 'id').get(providerId);
+}
+
+function findSession(state, sessionId) {
+  return getIndex(state.interactionSessions, 'id').get(sessionId);
+}
+
+function publicFile(name) {
+  return { filePath: path.join(publicDir, name), headers: staticHeaders.get(path.extname(name)) };
+}
+
+async function serveFile(res, file) {
+  try {
+    const data = await readFile(file.filePath);
+    res.writeHead(200, file.headers);
     res.end(data);
   } catch {
-    sendText(res, 404, 'Not found');
+    sendText(res, 404, notFoundText);
   }
 }
 
 function collectBody(req) {
   return new Promise((resolve, reject) => {
-    let data = '';
+    const chunks = [];
+    let size = 0;
     req.on('data', chunk => {
-      data += chunk;
-      if (data.length > 1_000_000) {
+      size += chunk.length;
+      if (size > 1_000_000) {
         reject(new Error('Body too large'));
         req.destroy();
+        return;
       }
+      chunks.push(chunk);
     });
-    req.on('end', () => resolve(data));
+    req.on('end', () => resolve(Buffer.concat(chunks, size).toString('utf8')));
     req.on('error', reject);
   });
 }
 
-function stampActivity(state, type, message) {
+function createId(prefix) {
+  const now = Date.now();
+  idSequence = now === lastIdTime ? idSequence + 1 : 0;
+  lastIdTime = now;
+  return idSequence ? `${prefix}-${now}-${idSequence}` : `${prefix}-${now}`;
+}
+
+function mergeFields(target, source, fields) {
+  for (const field of fields) target[field] = source[field] ?? target[field];
+  return target;
+}
+
+function stampActivity(state, type, message, timestamp) {
   state.activity.unshift({
-    id: `activity-${Date.now()}`,
+    id: createId('activity'),
     type,
     message,
-    timestamp: new Date().toISOString()
+    timestamp
   });
 }
 
-const server = http.createServer(async (req, res) => {
-  const url = new URL(req.url, 'http://localhost');
+const routes = new Map();
 
-  if (req.method === 'GET' && url.pathname === '/api/state') {
-    const state = await loadState();
-    return sendJson(res, 200, state);
+routes.set('GET /api/state', async (req, res) => {
+  const { body, etag } = await loadStateBody();
+  res.setHeader('ETag', etag);
+  if (req.headers['if-none-match'] === etag) {
+    res.writeHead(304, revalidateHeaders);
+    return res.end();
   }
+  res.writeHead(200, stateHeaders);
+  res.end(body);
+});
 
-  if (req.method === 'POST' && url.pathname === '/api/current-user') {
-    try {
-      const state = await loadState();
-      const body = JSON.parse(await collectBody(req));
-      const founderIdentity = body.founderIdentity || state.currentUser.founderIdentity || {};
-      state.currentUser = {
-        ...state.currentUser,
-        username: body.username ?? state.currentUser.username,
-        email: body.email ?? state.currentUser.email,
-        gender: body.gender ?? state.currentUser.gender,
-        birthday: body.birthday ?? state.currentUser.birthday,
-        birth_time: body.birth_time ?? state.currentUser.birth_time,
-        birth_location: body.birth_location ?? state.currentUser.birth_location,
-        founderIdentity: {
-          founderKey: founderIdentity.founderKey ?? '',
-          founderEmail: founderIdentity.founderEmail ?? body.email ?? state.currentUser.email ?? '',
-          recognized: Boolean(founderIdentity.recognized ?? state.currentUser.founderIdentity?.recognized ?? state.currentUser.founder_status),
-          role: founderIdentity.role ?? state.currentUser.founderIdentity?.role ?? 'Founder / Creator / CEO',
-          accessMode: founderIdentity.accessMode ?? state.currentUser.founderIdentity?.accessMode ?? 'account-recognized',
-          featureFlags: founderIdentity.featureFlags ?? state.currentUser.founderIdentity?.featureFlags ?? [
-            'founder-console',
-            'oracle-canon-edit',
-            'release-preview',
-            'provider-lab'
-          ]
-        },
-        preferences: {
-          ...state.currentUser.preferences,
-          oracle_voice_flavor: body.oracle_voice_flavor ?? state.currentUser.preferences.oracle_voice_flavor,
-          system_prompt_tone: body.system_prompt_tone ?? state.currentUser.preferences.system_prompt_tone
-        }
-      };
-      stampActivity(state, 'profile_updated', 'Updated current user profile for Pantheon onboarding.');
-      await saveState(state);
-      return sendJson(res, 200, { ok: true, currentUser: state.currentUser });
-    } catch (error) {
-      return sendJson(res, 400, { ok: false, error: error.message });
-    }
-  }
+routes.set('POST /api/current-user', async (req, res) => {
+  const state = await loadState();
+  const body = JSON.parse(await collectBody(req));
+  const now = new Date().toISOString();
+  const founderIdentity = body.founderIdentity || state.currentUser.founderIdentity || {};
+  state.currentUser = {
+    ...mergeFields({ ...state.currentUser }, body, profileFields),
+    founderIdentity: {
+      founderKey: founderIdentity.founderKey ?? '',
+      founderEmail: founderIdentity.founderEmail ?? body.email ?? state.currentUser.email ?? '',
+      recognized: Boolean(founderIdentity.recognized ?? state.currentUser.founderIdentity?.recognized ?? state.currentUser.founder_status),
+      role: founderIdentity.role ?? state.currentUser.founderIdentity?.role ?? 'Founder / Creator / CEO',
+      accessMode: founderIdentity.accessMode ?? state.currentUser.founderIdentity?.accessMode ?? 'account-recognized',
+      featureFlags: founderIdentity.featureFlags ?? state.currentUser.founderIdentity?.featureFlags ?? [
+        'founder-console',
+        'oracle-canon-edit',
+        'release-preview',
+        'provider-lab'
+      ]
+    },
+    preferences: mergeFields({ ...state.currentUser.preferences }, body, preferenceFields)
+  };
+  stampActivity(state, 'profile_updated', 'Updated current user profile for Pantheon onboarding.', now);
+  await saveState(state, now);
+  return sendJson(res, 200, { ok: true, currentUser: state.currentUser });
+});
 
-  if (req.method === 'POST' && url.pathname === '/api/chart/generate') {
-    try {
-      const state = await loadState();
-      state.astrologyProfile.generation = {
-        ...state.astrologyProfile.generation,
-        mode: 'prototype-seeded',
-        targetMode: 'birth-data-native',
-        validationSources: ['Astro-Seek', 'Startek'],
-        lastGeneratedAt: new Date().toISOString(),
-        status: {
-          birthDataCollected: Boolean(body.birthday && body.birth_time && body.birth_location),
-          nativeEngineReady: false,
-          validationPathReady: true,
-          profileAssemblyReady: true,
-          oracleAwakeningReady: true
-        }
-      };
-      stampActivity(state, 'chart_generation', 'Triggered chart generation flow from birth data. This prototype still uses seeded astrology data while native chart generation is being prepared and validation references are being aligned.');
-      await saveState(state);
-      return sendJson(res, 200, {
-        ok: true,
-        mode: 'prototype-seeded',
-        message: 'Chart generation flow triggered. Native calculation and validation/fallback references will plug into this endpoint.'
-      });
-    } catch (error) {
-      return sendJson(res, 400, { ok: false, error: error.message });
+routes.set('POST /api/chart/generate', async (req, res) => {
+  const state = await loadState();
+  const now = new Date().toISOString();
+  state.astrologyProfile.generation = {
+    ...state.astrologyProfile.generation,
+    mode: 'prototype-seeded',
+    targetMode: 'birth-data-native',
+    validationSources: ['Astro-Seek', 'Startek'],
+    lastGeneratedAt: now,
+    status: {
+      birthDataCollected: Boolean(body.birthday && body.birth_time && body.birth_location),
+      nativeEngineReady: false,
+      validationPathReady: true,
+      profileAssemblyReady: true,
+      oracleAwakeningReady: true
     }
-  }
+  };
+  stampActivity(state, 'chart_generation', 'Triggered chart generation flow from birth data. This prototype still uses seeded astrology data while native chart generation is being prepared and validation references are being aligned.', now);
+  await saveState(state, now);
+  return sendJson(res, 200, {
+    ok: true,
+    mode: 'prototype-seeded',
+    message: 'Chart generation flow triggered. Native calculation and validation/fallback references will plug into this endpoint.'
+  });
+});
 
-  if (req.method === 'POST' && url.pathname === '/api/providers') {
-    try {
-      const state = await loadState();
-      const body = JSON.parse(await collectBody(req));
-      const provider = state.llmProviders.find(item => item.id === body.id);
-      if (!provider) return sendJson(res, 404, { ok: false, error: 'Provider not found' });
-      provider.baseUrl = body.baseUrl ?? provider.baseUrl ?? '';
-      provider.model = body.model ?? provider.model ?? '';
-      provider.apiKeyStatus = body.apiKey ? 'provided' : (provider.apiKeyStatus || 'missing');
-      provider.enabled = body.enabled ?? provider.enabled;
-      state.interactionSessions = state.interactionSessions.map(session => session.providerId === provider.id
-        ? { ...session, model: provider.model || session.model || '', providerReady: Boolean(provider.enabled && provider.model && provider.apiKeyStatus === 'provided') }
-        : session);
-      stampActivity(state, 'provider_updated', `Updated provider configuration: ${provider.name}`);
-      await saveState(state);
-      return sendJson(res, 200, { ok: true, provider });
-    } catch (error) {
-      return sendJson(res, 400, { ok: false, error: error.message });
-    }
+routes.set('POST /api/providers', async (req, res) => {
+  const state = await loadState();
+  const body = JSON.parse(await collectBody(req));
+  const provider = findProvider(state, body.id);
+  if (!provider) return sendJsonBody(res, 404, providerNotFoundBody);
+  const now = new Date().toISOString();
+  provider.baseUrl = body.baseUrl ?? provider.baseUrl ?? '';
+  provider.model = body.model ?? provider.model ?? '';
+  provider.apiKeyStatus = body.apiKey ? 'provided' : (provider.apiKeyStatus || 'missing');
+  provider.enabled = body.enabled ?? provider.enabled;
+  const providerReady = Boolean(provider.enabled && provider.model && provider.apiKeyStatus === 'provided');
+  for (const session of state.interactionSessions) {
+    if (session.providerId !== provider.id) continue;
+    session.model = provider.model || session.model || '';
+    session.providerReady = providerReady;
   }
+  stampActivity(state, 'provider_updated', `Updated provider configuration: ${provider.name}`, now);
+  await saveState(state, now);
+  return sendJson(res, 200, { ok: true, provider });
+});
 
-  if (req.method === 'POST' && url.pathname === '/api/oracle-voice') {
-    try {
-      const state = await loadState();
-      const body = JSON.parse(await collectBody(req));
-      const oracle = state.oracles.find(item => item.oracle_id === body.oracleId);
-      if (!oracle) return sendJson(res, 404, { ok: false, error: 'Oracle not found' });
-      oracle.visual_attributes = oracle.visual_attributes || {};
-      oracle.visual_attributes.preferred_voice_profile = body.preferredVoiceProfile ?? oracle.visual_attributes.preferred_voice_profile ?? '';
-      oracle.visual_attributes.audio_ready = body.audioReady ?? oracle.visual_attributes.audio_ready ?? false;
-      oracle.oracle_metadata_last_updated = new Date().toISOString();
-      stampActivity(state, 'voice_updated', `Updated voice settings for ${oracle.oracle_name}`);
-      await saveState(state);
-      return sendJson(res, 200, { ok: true, oracle });
-    } catch (error) {
-      return sendJson(res, 400, { ok: false, error: error.message });
-    }
-  }
+routes.set('POST /api/oracle-voice', async (req, res) => {
+  const state = await loadState();
+  const body = JSON.parse(await collectBody(req));
+  const oracle = findOracle(state, body.oracleId);
+  if (!oracle) return sendJsonBody(res, 404, oracleNotFoundBody);
+  const now = new Date().toISOString();
+  oracle.visual_attributes = oracle.visual_attributes || {};
+  oracle.visual_attributes.preferred_voice_profile = body.preferredVoiceProfile ?? oracle.visual_attributes.preferred_voice_profile ?? '';
+  oracle.visual_attributes.audio_ready = body.audioReady ?? oracle.visual_attributes.audio_ready ?? false;
+  oracle.oracle_metadata_last_updated = now;
+  stampActivity(state, 'voice_updated', `Updated voice settings for ${oracle.oracle_name}`, now);
+  await saveState(state, now);
+  return sendJson(res, 200, { ok: true, oracle });
+});
 
-  if (req.method === 'POST' && url.pathname === '/api/sessions/message') {
-    try {
-      const state = await loadState();
-      const body = JSON.parse(await collectBody(req));
-      const session = state.interactionSessions.find(item => item.id === body.sessionId);
-      if (!session) return sendJson(res, 404, { ok: false, error: 'Session not found' });
-      if (!session.messages) session.messages = [];
-      const userMessage = {
-        role: 'user',
-        content: body.message || '',
-        timestamp: new Date().toISOString()
-      };
-      session.messages.push(userMessage);
-      session.lastMessageAt = userMessage.timestamp;
-
-      const oracle = state.oracles.find(item => item.oracle_id === session.oracleId);
-      const provider = state.llmProviders.find(item => item.id === session.providerId);
-      session.model = provider?.model || session.model || '';
-      session.providerReady = Boolean(provider?.enabled && provider?.model && provider?.apiKeyStatus === 'provided');
-      const oracleReply = {
-        role: 'oracle',
-        content: oracle
-          ? `${oracle.oracle_name}: I am present. ${session.providerReady ? `Your session is now bound to ${provider?.name || 'the configured provider'} using ${session.model || 'the selected model'}.` : `This session still needs a fully configured provider before true oracle generation can begin.`}`
-          : 'Oracle session active.',
-        timestamp: new Date().toISOString()
-      };
-      session.messages.push(oracleReply);
-      session.lastMessageAt = oracleReply.timestamp;
-      stampActivity(state, 'oracle_session', `Sent a message in ${session.title}`);
-      await saveState(state);
-      return sendJson(res, 200, { ok: true, session });
-    } catch (error) {
-      return sendJson(res, 400, { ok: false, error: error.message });
-    }
-  }
+routes.set('POST /api/sessions/message', async (req, res) => {
+  const state = await loadState();
+  const body = JSON.parse(await collectBody(req));
+  const session = findSession(state, body.sessionId);
+  if (!session) return sendJsonBody(res, 404, sessionNotFoundBody);
+  if (!session.messages) session.messages = [];
+  const now = new Date().toISOString();
+  const userMessage = {
+    role: 'user',
+    content: body.message || '',
+    timestamp: now
+  };
+  session.messages.push(userMessage);
+  session.lastMessageAt = userMessage.timestamp;
 
-  if (req.method === 'POST' && url.pathname === '/api/activity') {
-    try {
-      const state = await loadState();
-      const body = JSON.parse(await collectBody(req));
-      const entry = {
-        id: body.id || `activity-${Date.now()}`,
-        type: body.type || 'note',
-        message: body.message || 'Updated activity log.',
-        timestamp: new Date().toISOString()
-      };
-      state.activity.unshift(entry);
-      await saveState(state);
-      return sendJson(res, 200, { ok: true, entry });
-    } catch (error) {
-      return sendJson(res, 400, { ok: false, error: error.message });
-    }
-  }
+  const oracle = findOracle(state, session.oracleId);
+  const provider = findProvider(state, session.providerId);
+  session.model = provider?.model || session.model || '';
+  session.providerReady = Boolean(provider?.enabled && provider?.model && provider?.apiKeyStatus === 'provided');
+  const oracleReply = {
+    role: 'oracle',
+    content: oracle
+      ? `${oracle.oracle_name}: I am present. ${session.providerReady ? `Your session is now bound to ${provider?.name || 'the configured provider'} using ${session.model || 'the selected model'}.` : `This session still needs a fully configured provider before true oracle generation can begin.`}`
+      : 'Oracle session active.',
+    timestamp: now
+  };
+  session.messages.push(oracleReply);
+  session.lastMessageAt = oracleReply.timestamp;
+  stampActivity(state, 'oracle_session', `Sent a message in ${session.title}`, now);
+  await saveState(state, now);
+  return sendJson(res, 200, { ok: true, session });
+});
 
-  if (req.method === 'POST' && url.pathname === '/api/tasks') {
-    try {
-      const state = await loadState();
-      const body = JSON.parse(await collectBody(req));
-      const task = {
-        id: body.id || `task-${Date.now()}`,
-        projectId: body.projectId || 'unassigned',
-        title: body.title || 'Untitled task',
-        status: body.status || 'backlog',
-        priority: body.priority || 'normal',
-        owner: body.owner || 'Clawdbot',
-        notes: body.notes || '',
-        updatedAt: new Date().toISOString()
-      };
-      state.tasks.unshift(task);
-      stampActivity(state, 'task_created', `Created task: ${task.title}`);
-      await saveState(state);
-      return sendJson(res, 200, { ok: true, task });
-    } catch (error) {
-      return sendJson(res, 400, { ok: false, error: error.message });
-    }
+routes.set('POST /api/activity', async (req, res) => {
+  const state = await loadState();
+  const body = JSON.parse(await collectBody(req));
+  const now = new Date().toISOString();
+  const entry = {
+    id: body.id || createId('activity'),
+    type: body.type || 'note',
+    message: body.message || 'Updated activity log.',
+    timestamp: now
+  };
+  state.activity.unshift(entry);
+  await saveState(state, now);
+  return sendJson(res, 200, { ok: true, entry });
+});
+
+routes.set('POST /api/tasks', async (req, res) => {
+  const state = await loadState();
+  const body = JSON.parse(await collectBody(req));
+  const now = new Date().toISOString();
+  const task = {
+    id: body.id || createId('task'),
+    projectId: body.projectId || 'unassigned',
+    title: body.title || 'Untitled task',
+    status: body.status || 'backlog',
+    priority: body.priority || 'normal',
+    owner: body.owner || 'Clawdbot',
+    notes: body.notes || '',
+    updatedAt: now
+  };
+  state.tasks.unshift(task);
+  stampActivity(state, 'task_created', `Created task: ${task.title}`, now);
+  await saveState(state, now);
+  return sendJson(res, 200, { ok: true, task });
+});
+
+routes.set('POST /api/oracle-note', async (req, res) => {
+  const state = await loadState();
+  const body = JSON.parse(await collectBody(req));
+  const oracle = findOracle(state, body.oracleId) || state.oracles.find(item => item.id === body.oracleId);
+  if (!oracle) return sendJsonBody(res, 404, oracleNotFoundBody);
+  const now = new Date().toISOString();
+  oracle.lastContact = now;
+  const existingNotes = oracle.visual_attributes?.additional_notes || oracle.notes || '';
+  if (oracle.visual_attributes) {
+    oracle.visual_attributes.additional_notes = [existingNotes, body.message].filter(Boolean).join(' | ');
+  } else {
+    oracle.notes = [existingNotes, body.message].filter(Boolean).join(' | ');
   }
+  oracle.oracle_metadata_last_updated = now;
+  stampActivity(state, 'oracle_note', `Logged oracle note for ${oracle.oracle_name || oracle.name}`, now);
+  await saveState(state, now);
+  return sendJson(res, 200, { ok: true, oracle });
+});
 
-  if (req.method === 'POST' && url.pathname === '/api/oracle-note') {
-    try {
-      const state = await loadState();
-      const body = JSON.parse(await collectBody(req));
-      const oracle = state.oracles.find(item => item.oracle_id === body.oracleId || item.id === body.oracleId);
-      if (!oracle) return sendJson(res, 404, { ok: false, error: 'Oracle not found' });
-      oracle.lastContact = new Date().toISOString();
-      const existingNotes = oracle.visual_attributes?.additional_notes || oracle.notes || '';
-      if (oracle.visual_attributes) {
-        oracle.visual_attributes.additional_notes = [existingNotes, body.message].filter(Boolean).join(' | ');
-      } else {
-        oracle.notes = [existingNotes, body.message].filter(Boolean).join(' | ');
-      }
-      oracle.oracle_metadata_last_updated = new Date().toISOString();
-      stampActivity(state, 'oracle_note', `Logged oracle note for ${oracle.oracle_name || oracle.name}`);
-      await saveState(state);
-      return sendJson(res, 200, { ok: true, oracle });
-    } catch (error) {
-      return sendJson(res, 400, { ok: false, error: error.message });
+routes.set('POST /api/oracles', async (req, res) => {
+  const state = await loadState();
+  const body = JSON.parse(await collectBody(req));
+  const now = new Date().toISOString();
+  const oracle = buildOracleRecord(body, {
+    oracleId: body.oracle_id || createId('oracle'),
+    timestamp: now,
+    defaults: {
+      council_type: 'Unassigned',
+      tone_overlay: body.mission,
+      role_in_pantheon: body.mission,
+      additional_notes: body.notes
+    },
+    overrides: {
+      ...emptyOracleExtras,
+      oracle_name: body.name || body.oracle_name || 'Unnamed Oracle',
+      oracle_voice: body.voice || body.oracle_voice || 'Undefined'
     }
-  }
+  });
+  state.oracles.unshift(oracle);
+  getIndex(state.oracles, 'oracle_id').set(oracle.oracle_id, oracle);
+  stampActivity(state, 'oracle_created', `Created oracle profile: ${oracle.oracle_name}`, now);
+  await saveState(state, now);
+  return sendJson(res, 200, { ok: true, oracle });
+});
 
-  if (req.method === 'POST' && url.pathname === '/api/oracles') {
+const server = http.createServer(async (req, res) => {
+  const url = new URL(req.url, 'http://localhost');
+  const route = routes.get(`${req.method} ${url.pathname}`);
+  if (route) {
     try {
-      const state = await loadState();
-      const body = JSON.parse(await collectBody(req));
-      const now = new Date().toISOString();
-      const oracle = {
-        oracle_id: body.oracle_id || `oracle-${Date.now()}`,
-        oracle_name: body.name || body.oracle_name || 'Unnamed Oracle',
-        archetype: body.archetype || 'Unformed Oracle',
-        oracle_type: body.oracle_type || 'Playable',
-        astrology_profile: {
-          ruling_planet: body.ruling_planet || '',
-          dominant_sign: body.dominant_sign || '',
-          house_placement: body.house_placement || '',
-          motion: body.motion || 'Direct',
-          stationary: body.stationary || '',
-          shadow: body.shadow || '',
-          degree: body.degree || '',
-          degree_mark: body.degree_mark || '',
-          decan: {
-            method: body.decan_method || 'Modern',
-            decan_ruler: body.decan_ruler || '',
-            decan_ruler_sign: body.decan_ruler_sign || '',
-            flavor: body.decan_flavor || 'Full'
-          },
-          rising_sign: body.rising_sign || '',
-          rising_decan_sign: body.rising_decan_sign || ''
-        },
-        faction_affiliation: {
-          core_faction: body.core_faction || '',
-          planetary_faction: body.planetary_faction || '',
-          tribe: body.tribe || '',
-          guild: body.guild || ''
-        },
-        hardcore_status: body.hardcore_status ?? true,
-        level: body.level || 0,
-        tier: body.tier || 'Tier 1',
-        ascended_rank: body.ascended_rank || 0,
-        oracle_form: body.oracle_form || 'Base',
-        council_type: body.council_type || 'Unassigned',
-        descendant_relationship_state: body.descendant_relationship_state || 'Dormant',
-        oracle_locked: false,
-        oracle_voice: body.voice || body.oracle_voice || 'Undefined',
-        tone_overlay: body.tone_overlay || body.mission || '',
-        oracle_metadata_last_updated: now,
-        anointed_ruler: false,
-        modern_ruler: false,
-        traditional_ruler: false,
-        dominant_ruler: false,
-        solar_ruler: false,
-        has_shapeshift: false,
-        shapeshift_description: '',
-        has_pet: false,
-        pet_name: '',
-        pet_description: '',
-        has_apprentice: false,
-        apprentice_name: '',
-        apprentice_description: '',
-        has_disciple: false,
-        disciple_name: '',
-        disciple_description: '',
-        has_legion: false,
-        legion_name: '',
-        legion_description: '',
-        has_legion_captain: false,
-        legion_captain_name: '',
-        legion_captain_description: '',
-        has_behemoth: false,
-        behemoth_name: '',
-        behemoth_description: '',
-        has_behemoth_fusion: false,
-        behemoth_fusion_name: '',
-        behemoth_fusion_crown: false,
-        behemoth_fusion_aura: false,
-        behemoth_fusion_description: '',
-        visual_attributes: {
-          visual_description: {
-            head: body.head || '',
-            torso: body.torso || '',
-            arms: body.arms || '',
-            legs: body.legs || '',
-            aura: body.aura || '',
-            ambient_flavor: body.ambient_flavor || '',
-            visual_style_notes: body.visual_style_notes || '',
-            color_scheme: body.color_scheme || ''
-          },
-          weapons: {
-            weapon_1: body.weapon_1 || '',
-            weapon_2: body.weapon_2 || ''
-          },
-          oracle_avatar_url: body.oracle_avatar_url || '',
-          voice_style: body.voice_style || body.voice || '',
-          role_in_pantheon: body.role_in_pantheon || body.mission || '',
-          additional_notes: body.additional_notes || body.notes || ''
-        }
-      };
-      state.oracles.unshift(oracle);
-      stampActivity(state, 'oracle_created', `Created oracle profile: ${oracle.oracle_name}`);
-      await saveState(state);
-      return sendJson(res, 200, { ok: true, oracle });
+      return await route(req, res);
     } catch (error) {
       return sendJson(res, 400, { ok: false, error: error.message });
     }
   }
 
-  if (req.method === 'GET' && (url.pathname === '/' || url.pathname === '/index.html')) {
-    return serveFile(res, path.join(publicDir, 'index.html'), 'text/html; charset=utf-8');
-  }
-  if (req.method === 'GET' && url.pathname === '/styles.css') {
-    return serveFile(res, path.join(publicDir, 'styles.css'), 'text/css; charset=utf-8');
-  }
-  if (req.method === 'GET' && url.pathname === '/app.js') {
-    return serveFile(res, path.join(publicDir, 'app.js'), 'text/javascript; charset=utf-8');
-  }
+  const staticFile = req.method === 'GET' && staticFiles.get(url.pathname);
+  if (staticFile) return serveFile(res, staticFile);
 
-  sendText(res, 404, 'Not found');
+  sendText(res, 404, notFoundText);
 });
 
+server.keepAliveTimeout = 65_000;
+server.headersTimeout = 66_000;
+
 const port = Number(process.env.PORT || 4317);
+await loadState();
 server.listen(port, '0.0.0.0', () => {
   console.log(`Clawdbot Console running on http://0.0.0.0:${port}`);
 });